@@ -1,7 +1,7 @@
 source VERSION
 sed -e 's#{VERSION}#'"${VERSION}"'#g' setup_template.py > setup.py
 
-rm -R build/
+rm -Rf build/
 python3 setup.py build sdist bdist_wheel
 
 pdoc --docformat="google" src/pumpwood_streamlit -o ./docs
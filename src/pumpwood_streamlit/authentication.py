@@ -1,12 +1,50 @@
 """Class to help fetching authetication headers from Streamlit."""
 import os
+import hashlib
 import streamlit as st
+from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
-from pumpwood_communication.microservices import PumpWoodMicroService
 from pumpwood_streamlit.exceptions import (
     PumpwoodStreamlitUnauthorizedException,
     PumpwoodStreamlitConfigException)
 
+if TYPE_CHECKING:
+    from pumpwood_communication.microservices import PumpWoodMicroService
+
+
+# Environment variables are read once at import, they are not expected
+# to change while the dashboard is running
+_DEBUG_AUTHORIZATION_TOKEN = os.getenv("DEBUG_AUTHORIZATION_TOKEN")
+_DEBUG_AUTH_HEADER = None
+if _DEBUG_AUTHORIZATION_TOKEN:
+    _DEBUG_AUTH_HEADER = {"Authorization": _DEBUG_AUTHORIZATION_TOKEN}
+_DEPLOY = os.getenv("DEPLOY", "FALSE") == "TRUE"
+
+_AUTH_HEADER_STATE = "_pumpwood_auth_header"
+"""Streamlit state used to keep the auth header of the session, it does
+   not use StateManager `pumpwood_st__` prefix since it is internal."""
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_check_if_logged(token_hash: str,
+                            _microservice: "PumpWoodMicroService",
+                            _auth_header: dict) -> bool:
+    """Check if auth header is logged caching results for 60 seconds.
+
+    `st.cache_data` is shared across sessions, so results are keyed
+    only by the hash of the token; arguments starting with `_` are not
+    hashed by Streamlit.
+
+    Args:
+        token_hash (str):
+            Hash of the authorization token, used as cache key.
+        _microservice (PumpWoodMicroService):
+            Microservice used to validate the token.
+        _auth_header (dict):
+            Auth header that will be validated.
+    """
+    return _microservice.check_if_logged(auth_header=_auth_header)
+
 
 class StreamlitAutheticationABC(ABC):
     """Abstract class to implement Autentication on Streamlit."""
@@ -36,43 +74,48 @@ class StreamlitPumpwoodAuthetication(StreamlitAutheticationABC):
     """Class for auth validation using Pumpwood end-points."""
 
     auth_header: dict
-    """Auth header asssociated with session."""
+    """Debug auth header set by `DEBUG_AUTHORIZATION_TOKEN`, session auth
+       header is kept at `st.session_state`."""
 
-    microservice: PumpWoodMicroService
+    microservice: "PumpWoodMicroService"
     """PumpWoodMicroService object to validate if auth_header is correct."""
 
-    def __init__(self, microservice: PumpWoodMicroService):
+    def __init__(self, microservice: "PumpWoodMicroService"):
         """__init__."""
-        self.auth_header = None
         self.microservice = microservice
 
-        # If env variable DEBUG_AUTHORIZATION_TOKEN is set then set
-        # header for local development
-        DEBUG_AUTHORIZATION_TOKEN = \
-            os.getenv("DEBUG_AUTHORIZATION_TOKEN")
-
         # Use deploy variable to not deploy dashboards with
         # DEBUG_AUTHORIZATION_TOKEN
-        DEPLOY = os.getenv("DEPLOY", "FALSE") == "TRUE"
-        if DEBUG_AUTHORIZATION_TOKEN:
-            if DEPLOY:
-                msg = (
-                    "Should not use 'DEBUG_AUTHORIZATION_TOKEN' env " +
-                    "variable on production.")
-                raise PumpwoodStreamlitConfigException(msg)
-            else:
-                self.auth_header = {
-                    "Authorization": DEBUG_AUTHORIZATION_TOKEN}
+        if _DEBUG_AUTH_HEADER is not None and _DEPLOY:
+            msg = (
+                "Should not use 'DEBUG_AUTHORIZATION_TOKEN' env " +
+                "variable on production.")
+            raise PumpwoodStreamlitConfigException(msg)
+
+        # If env variable DEBUG_AUTHORIZATION_TOKEN is set then set
+        # header for local development
+        self.auth_header = _DEBUG_AUTH_HEADER
 
     def get_auth_header(self):
-        """Get auth header from cookies token."""
-        if self.auth_header is None:
-            context_cookies = dict(st.context.cookies)
-            cookieauth_header = context_cookies.get("PumpwoodAuthorization")
+        """Get auth header from cookies token.
+
+        Header is stored at `st.session_state` after first read, so the
+        cookie is parsed once per session. Object may be shared between
+        sessions, header must not be stored on it.
+        """
+        # Debug header set by DEBUG_AUTHORIZATION_TOKEN
+        if self.auth_header is not None:
+            return self.auth_header
+
+        auth_header = st.session_state.get(_AUTH_HEADER_STATE)
+        if auth_header is None:
+            cookieauth_header = st.context.cookies.get(
+                "PumpwoodAuthorization")
             if cookieauth_header is not None:
-                self.auth_header = {
+                auth_header = {
                     "Authorization": 'Token ' + cookieauth_header}
-        return self.auth_header
+                st.session_state[_AUTH_HEADER_STATE] = auth_header
+        return auth_header
 
     def check_if_logged(self, raise_error: bool = True):
         """
@@ -84,8 +127,18 @@ class StreamlitPumpwoodAuthetication(StreamlitAutheticationABC):
                 return false if `raise_error=False`.
         """
         auth_header = self.get_auth_header()
-        is_logged = self.microservice.check_if_logged(
-            auth_header=auth_header)
+
+        # Without a token the request to Pumpwood Auth would always fail,
+        # no need to make it
+        token = (auth_header or {}).get("Authorization")
+        if not token:
+            is_logged = False
+        else:
+            token_hash = hashlib.blake2b(
+                token.encode(), digest_size=16).hexdigest()
+            is_logged = _cached_check_if_logged(
+                token_hash=token_hash, _microservice=self.microservice,
+                _auth_header=auth_header)
         if not is_logged and raise_error:
             msg = (
                 "Authetication header is not valid, try to login again on "
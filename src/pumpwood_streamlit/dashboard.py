@@ -1,12 +1,47 @@
 """Dashboard class to use as base from Pumpwood Streamlit Dashboards."""
 import os
-import traceback
 import streamlit as st
+from typing import TYPE_CHECKING
 from abc import ABC, abstractmethod
-from pumpwood_communication.microservices import PumpWoodMicroService
 from pumpwood_communication.exceptions import PumpWoodException
 from pumpwood_streamlit.authentication import StreamlitAutheticationABC
 
+if TYPE_CHECKING:
+    from pumpwood_communication.microservices import PumpWoodMicroService
+
+
+# Environment variables are read once at import, they are not expected
+# to change while the dashboard is running
+_STYLES_DIR = os.getenv("PUMPWOOD_DASHBOARD__STYLES_DIR", "static/styles")
+
+
+@st.cache_resource(show_spinner=False)
+def _build_css_bundle(styles_dir: str, mtimes: tuple) -> str:
+    """Read and concatenate css files from styles folder in a style tag.
+
+    Result is cached by Streamlit, files are read again only if a file
+    is added, removed or modified at styles folder.
+
+    Args:
+        styles_dir (str):
+            Path to the folder with the css files.
+        mtimes (tuple):
+            Tuple of `(file name, modification time)` of the css files,
+            sorted by file name. Used as cache key and to set the order
+            of the files at the bundle.
+    """
+    all_styles = []
+    for file, _ in mtimes:
+        file_path = os.path.join(styles_dir, file)
+        file_break = (
+            "\n/* ### Styles from file [{file}] ### */").format(
+                file=file)
+        all_styles.append(file_break.encode("utf-8"))
+        with open(file_path, "rb") as css_file:
+            all_styles.append(css_file.read())
+    css = b'\n'.join(all_styles).decode("utf-8")
+    return "<style> " + css + " </style>"
+
 
 class PumpwoodStreamlitDashboard(ABC):
     """Abstract Class to facilitate criation of Streamlit Dashboards."""
@@ -14,13 +49,28 @@ class PumpwoodStreamlitDashboard(ABC):
     @property
     @abstractmethod
     def streamlit_auth(self) -> StreamlitAutheticationABC:
-        """Object of sub-class StreamlitAutheticationABC."""
+        """Object of sub-class StreamlitAutheticationABC.
+
+        It is accessed on every rerun, set it as a class attribute or
+        `functools.cached_property` so it is not created at each access.
+
+        Example:
+        ```python
+        class Dashboard(PumpwoodStreamlitDashboard):
+            microservice = microservice
+            streamlit_auth = streamlit_auth
+        ```
+        """
         pass
 
     @property
     @abstractmethod
-    def microservice(self) -> PumpWoodMicroService:
-        """Object of PumpWoodMicroService."""
+    def microservice(self) -> "PumpWoodMicroService":
+        """Object of PumpWoodMicroService.
+
+        As `streamlit_auth`, set it as a class attribute or
+        `functools.cached_property` so it is not created at each access.
+        """
         pass
 
     def authentication_error_page(self) -> None:
@@ -41,15 +91,19 @@ class PumpwoodStreamlitDashboard(ABC):
 
         Render a default page for PumpwoodStreamlitException.
         """
+        # Imported here since it is only used on error path
+        import traceback
+
         exception_dict = exception.to_dict()
-        tb = traceback.format_exc()
         with st.container():
             st.header("Error when running dashboard")
             st.text(exception_dict['message'])
 
+        # Keep only the innermost frames, they are the ones that matter
+        # for debug and it bounds the size of deep stacks
         with st.container():
-            with st.expander("Debug traceback"):
-                st.write(tb)
+            with st.expander("Debug traceback", expanded=False):
+                st.code(traceback.format_exc(limit=-50), language=None)
 
     def run(self) -> None:
         """Render Streamlit dashboard.
@@ -127,24 +181,15 @@ class PumpwoodStreamlitDashboard(ABC):
 
         Read all css files at a style folder and add them to dashboard.
         Styles folder is set using `PUMPWOOD_DASHBOARD__STYLES_DIR`
-        enviroment variable, it default as `styles`.
+        enviroment variable, it default as `static/styles`. Files are read only
+        when they change, reruns use the cached css.
         """
-        PUMPWOOD_DASHBOARD__STYLES_DIR = \
-            os.getenv("PUMPWOOD_DASHBOARD__STYLES_DIR", "static/styles")
-        all_styles = []
-        for file in os.listdir(PUMPWOOD_DASHBOARD__STYLES_DIR):
-            if file.endswith(".css"):
-                file_path = os.path.join(PUMPWOOD_DASHBOARD__STYLES_DIR, file)
-                file_break = (
-                    "\n/* ### Styles from file [{file}] ### */").format(
-                        file=file)
-                all_styles.append(file_break)
-                with open(file_path, "r") as file:
-                    all_styles.append(file.read())
-        css = '\n'.join(all_styles)
-        st.markdown(
-            "<style> {css} </style>".format(css=css),
-            unsafe_allow_html=True)
+        with os.scandir(_STYLES_DIR) as entries:
+            mtimes = tuple(sorted(
+                (entry.name, entry.stat().st_mtime) for entry in entries
+                if entry.name.endswith(".css") and entry.is_file()))
+        css = _build_css_bundle(styles_dir=_STYLES_DIR, mtimes=mtimes)
+        st.markdown(css, unsafe_allow_html=True)
 
     @abstractmethod
     def main_view(self) -> None:
@@ -1,23 +1,56 @@
 """Class to help to manager app states get/set triggers."""
 import streamlit as st
 import inspect
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Tuple
 from pumpwood_streamlit.exceptions import (
     PumpwoodStreamlitConfigException, PumpwoodStreamlitException,
     PumpwoodStreamlitStateNotFoundException)
 from abc import ABC
 
 
+_MISSING = object()
+"""Sentinel for states not found at `st.session_state` and for not
+   informed default values."""
+
+
 class StateTrigger(ABC):
     """Abstract class for setting triggers."""
 
+    __slots__ = (
+        '_trigger_fun', '_change_states', '_fun_path', '_fun_name',
+        '_cached_dict')
+
+    _PHASE = None
+    """Index of the trigger type at grouped triggers, 0 before get,
+       1 after get, 2 before set and 3 after set. Triggers without phase
+       are not run."""
+
+    _TYPE_NAME = 'StateTrigger'
+    """Name of the trigger class used on serialization, set for each
+       sub-class at `__init_subclass__`."""
+
     _trigger_fun: Callable
     """Function that will be called at action triggered."""
 
-    _change_states: List[str]
+    _change_states: Tuple[str, ...]
     """Informational fields that describe which states will be changed with
        the triggered function."""
 
+    _fun_path: str
+    """Path of the file where trigger function was defined, None if it
+       can not be resolved."""
+
+    _fun_name: str
+    """Name of the trigger function."""
+
+    _cached_dict: dict
+    """Serialized trigger, created at `__init__`."""
+
+    def __init_subclass__(cls, **kwargs):
+        """Set `_TYPE_NAME` of the trigger sub-class."""
+        super().__init_subclass__(**kwargs)
+        cls._TYPE_NAME = cls.__name__
+
     def __init__(self, fun: Callable, change_states: list):
         """__init__.
 
@@ -29,39 +62,119 @@ class StateTrigger(ABC):
                 at `fun` function.
         """
         self._trigger_fun = fun
-        self._change_states = change_states
+        # Copy to a tuple so serialized trigger does not alias the list
+        # passed by the caller
+        self._change_states = tuple(change_states)
+        # Functions carry the file path at their code object, use
+        # inspect only for other callables. Partials and callable objects
+        # have no file or name, they are still valid triggers
+        fun_code = getattr(fun, '__code__', None)
+        if fun_code is not None:
+            self._fun_path = fun_code.co_filename
+        else:
+            try:
+                self._fun_path = inspect.getfile(fun)
+            except TypeError:
+                self._fun_path = None
+        self._fun_name = getattr(fun, '__name__', repr(fun))
+        self._cached_dict = {
+            'trigger_type': self._TYPE_NAME,
+            'trigger_fun_path': self._fun_path,
+            'trigger_fun_name': self._fun_name,
+            'trigger_change_states': self._change_states
+        }
 
     def run(self, **kwargs):
         """Run function associated with trigger passing kwargs."""
         return self._trigger_fun(**kwargs)
 
     def to_dict(self):
-        """Serialize trigger."""
-        function_path = inspect.getfile(self._trigger_fun)
-        function_name = self._trigger_fun.__name__
-        return {
-            'trigger_type': type(self).__name__,
-            'trigger_fun_path': function_path,
-            'trigger_fun_name': function_name,
-            'trigger_change_states': self._change_states
-        }
+        """Serialize trigger.
+
+        Trigger does not change after creation, serialization is created
+        at `__init__` and the same dictionary is returned on every call,
+        it must not be mutated. Copy it before adding fields.
+        """
+        return self._cached_dict
 
 
 class StateBeforeGetTrigger(StateTrigger):
     """Class for setting Before Get triggers at Streamlit states."""
 
+    __slots__ = ()
+    _PHASE = 0
+
 
 class StateAfterGetTrigger(StateTrigger):
     """Class for setting After Get triggers at Streamlit states."""
 
+    __slots__ = ()
+    _PHASE = 1
+
 
 class StateBeforeSetTrigger(StateTrigger):
     """Class for setting Before Set triggers at Streamlit states."""
 
+    __slots__ = ()
+    _PHASE = 2
+
 
 class StateAfterSetTrigger(StateTrigger):
     """Class for setting After Set triggers at Streamlit states."""
 
+    __slots__ = ()
+    _PHASE = 3
+
+
+def _compile_triggers(triggers: dict) -> dict:
+    """Validate triggers and group them by type for each state.
+
+    Only states with triggers are added to the result, states not
+    present have no triggers.
+
+    Args:
+        triggers (dict):
+            Triggers definition, same format as `StateManager.TRIGGERS`.
+    Return:
+        Return a dictionary with state as key and a tuple
+        `(before_get, after_get, before_set, after_set)` with a tuple
+        of triggers of each type as value.
+    Raises:
+        PumpwoodStreamlitConfigException:
+            If any entry of triggers is not a list or a trigger has an
+            invalid `_PHASE`.
+    """
+    compiled_triggers = {}
+    for state, state_name_triggers in triggers.items():
+        if not isinstance(state_name_triggers, list):
+            msg = (
+                'StateManager.TRIGGERS entry for state [{state}] if not '
+                'a list or not set. Check dashboard '
+                'StateManager.TRIGGERS definition')
+            raise PumpwoodStreamlitConfigException(
+                message=msg, payload={'state': state})
+        if not state_name_triggers:
+            continue
+
+        phases = ([], [], [], [])
+        for trigger in state_name_triggers:
+            phase = getattr(trigger, '_PHASE', None)
+            if phase is None:
+                continue
+            if phase not in (0, 1, 2, 3):
+                msg = (
+                    'Trigger [{trigger}] of state [{state}] has invalid '
+                    '_PHASE [{phase}], it must be 0, 1, 2 or 3. Check '
+                    'trigger class definition')
+                raise PumpwoodStreamlitConfigException(
+                    message=msg, payload={
+                        'state': state, 'trigger': repr(trigger),
+                        'phase': phase})
+            phases[phase].append(trigger)
+        compiled_triggers[state] = tuple(
+            tuple(phase_triggers) for phase_triggers in phases)
+    return compiled_triggers
+
 
 class StateManager:
     """Class to help managing streamlit session states.
@@ -89,7 +202,62 @@ class StateManager:
         ]
     }
     ```
+
+    Triggers are validated and grouped when the sub-class is created.
+    Assigning a new dictionary to `TRIGGERS` is detected on next get/set,
+    but changes made in place (ex.: `TRIGGERS['state'] = [...]`) are
+    not, use `set_triggers` to change triggers at runtime.
     """
+
+    _COMPILED_TRIGGERS = {}
+    """Triggers of states that have any, grouped by type by
+       `_compile_triggers`."""
+
+    _COMPILED_SOURCE = TRIGGERS
+    """`TRIGGERS` object used to create `_COMPILED_TRIGGERS`."""
+
+    _PREFIX = 'pumpwood_st__'
+    """Prefix of the states managed by StateManager."""
+
+    _PREFIX_LEN = len(_PREFIX)
+    """Length of `_PREFIX`, set again on sub-classes."""
+
+    def __init_subclass__(cls, **kwargs):
+        """Validate and group `TRIGGERS` when sub-class is created."""
+        super().__init_subclass__(**kwargs)
+        cls._COMPILED_TRIGGERS = _compile_triggers(cls.TRIGGERS)
+        cls._COMPILED_SOURCE = cls.TRIGGERS
+        cls._PREFIX_LEN = len(cls._PREFIX)
+
+    @classmethod
+    def set_triggers(cls, triggers: dict) -> None:
+        """Set `TRIGGERS` at runtime grouping triggers again.
+
+        Args:
+            triggers (dict):
+                Dictionary with state name as key and a list of triggers
+                as value, same format as `TRIGGERS`.
+        """
+        compiled_triggers = _compile_triggers(triggers)
+        cls.TRIGGERS = triggers
+        cls._COMPILED_TRIGGERS = compiled_triggers
+        cls._COMPILED_SOURCE = triggers
+
+    @classmethod
+    def _get_compiled_triggers(cls) -> dict:
+        """Get grouped triggers, grouping again if `TRIGGERS` was replaced.
+
+        Return:
+            Return `_COMPILED_TRIGGERS` for current `TRIGGERS`.
+        """
+        # Do not use set_triggers, it would set TRIGGERS on sub-classes
+        # that inherit it from parent class
+        triggers = cls.TRIGGERS
+        if triggers is not cls._COMPILED_SOURCE:
+            cls._COMPILED_TRIGGERS = _compile_triggers(triggers)
+            cls._COMPILED_SOURCE = triggers
+        return cls._COMPILED_TRIGGERS
+
     @classmethod
     def does_state_exists(cls, state: str,
                           raise_if_not_found: bool = True) -> bool:
@@ -128,18 +296,22 @@ class StateManager:
                 at streamlit states. Setting `force_value (bool) = True` will
                 reverse this behaivor.
         """
-        if (state not in st.session_state) or force_value:
-            st.session_state[state] = init_value
+        session_state = st.session_state
+        if force_value or (state not in session_state):
+            session_state[state] = init_value
         return state
 
     @classmethod
     def get_state(cls, state: str) -> Any:
         """Get state from Streamlit state."""
-        cls.does_state_exists(state=state)
-        return st.session_state[state]
+        state_value = st.session_state.get(state, _MISSING)
+        if state_value is _MISSING:
+            # Raise state not found error
+            cls.does_state_exists(state=state)
+        return state_value
 
     @classmethod
-    def get_value(cls, state: str, default_value: Any = "__empty_value__",
+    def get_value(cls, state: str, default_value: Any = _MISSING,
                   **kwargs) -> Any:
         """
         Get value from streamlit `session_state`.
@@ -155,7 +327,8 @@ class StateManager:
                 diferentiate from other non maneged states.
             default_value (Any):
                 Return a default value if state is not found on Streamlit
-                states.
+                states. If not informed, raise an error if state is not
+                found.
         Kwargs:
             Other arguments will be passed as kwargs to function associated
             with the triggers.
@@ -163,40 +336,33 @@ class StateManager:
             Return value of `pumpwood_st__{state}` state found on Streamlit
             state.
         """
-        is_val_state_present = (
-            (state in st.session_state) or
-            (default_value != "__empty_value__"))
-        if not is_val_state_present:
-            msg = (
-                "State [{state}] was not found at Streamlit "
-                "`session_state`. Check if state was initiated or set a "
-                "default_value on get function.")
-            raise PumpwoodStreamlitStateNotFoundException(
-                message=msg, payload={"state": state})
+        session_state = st.session_state
+        state_value = session_state.get(state, _MISSING)
+        if state_value is _MISSING:
+            if default_value is _MISSING:
+                msg = (
+                    "State [{state}] was not found at Streamlit "
+                    "`session_state`. Check if state was initiated or set a "
+                    "default_value on get function.")
+                raise PumpwoodStreamlitStateNotFoundException(
+                    message=msg, payload={"state": state})
+            state_value = default_value
 
-        state_name_triggers = cls.TRIGGERS.get(state, [])
-        is_type_validation_ok = (
-            isinstance(state_name_triggers, list))
-        if not is_type_validation_ok:
-            msg = (
-                'StateManager.TRIGGERS entry for state [{state}] if not a ' +
-                'list or not set. Check dashboard StateManager.TRIGGERS ' +
-                'definition')
-            raise PumpwoodStreamlitConfigException(
-                message=msg, payload={'state': state})
+        state_name_triggers = cls._get_compiled_triggers().get(state)
+        if state_name_triggers is None:
+            return state_value
+        before_get, after_get, _, _ = state_name_triggers
 
-        # Run all trigger of before get before fetching state information
-        for trigger in state_name_triggers:
-            if isinstance(trigger, StateBeforeGetTrigger):
+        # Run all trigger of before get before fetching state information,
+        # triggers may change the state so it is fetched again
+        if before_get:
+            for trigger in before_get:
                 trigger.run(**kwargs)
-
-        # Get state value or return the default_value
-        state_value = st.session_state.get(state, default_value)
+            state_value = session_state.get(state, state_value)
 
         # Run all trigger of after get after fetching state information
-        for trigger in state_name_triggers:
-            if isinstance(trigger, StateAfterGetTrigger):
-                trigger.run(**kwargs)
+        for trigger in after_get:
+            trigger.run(**kwargs)
         return state_value
 
     @classmethod
@@ -224,9 +390,12 @@ class StateManager:
             Return value of `pumpwood_st__{state}` state found on Streamlit
             state.
         """
+        session_state = st.session_state
+
+        # Skip the session state probe if init errors are ignored
         is_val_state_present = (
-            (state in st.session_state) or
-            ignore_init_error)
+            ignore_init_error or
+            (state in session_state))
         if not is_val_state_present:
             msg = (
                 "State [{state}] was not found at Streamlit "
@@ -235,28 +404,98 @@ class StateManager:
             raise PumpwoodStreamlitStateNotFoundException(
                 message=msg, payload={"state": state})
 
-        state_name_triggers = cls.TRIGGERS.get(state, [])
-        is_type_validation_ok = (
-            isinstance(state_name_triggers, list))
-        if not is_type_validation_ok:
-            msg = (
-                'StateManager.TRIGGERS entry for state [{state}] if not a ' +
-                'list or not set. Check dashboard StateManager.TRIGGERS ' +
-                'definition')
-            raise PumpwoodStreamlitConfigException(
-                message=msg, payload={'state': state})
+        state_name_triggers = cls._get_compiled_triggers().get(state)
+        if state_name_triggers is None:
+            session_state[state] = value
+            return True
+        _, _, before_set, after_set = state_name_triggers
 
         # Run all trigger of before get before fetching state information
-        for trigger in state_name_triggers:
-            if isinstance(trigger, StateBeforeSetTrigger):
-                trigger.run(**kwargs)
+        for trigger in before_set:
+            trigger.run(**kwargs)
 
         # Get state value or return the default_value
-        st.session_state[state] = value
+        session_state[state] = value
 
         # Run all trigger of after get after fetching state information
-        for trigger in state_name_triggers:
-            if isinstance(trigger, StateAfterSetTrigger):
+        for trigger in after_set:
+            trigger.run(**kwargs)
+        return True
+
+    @classmethod
+    def get_many(cls, states: List[str],
+                 default_value: Any = _MISSING,
+                 **kwargs) -> dict:
+        """
+        Get values of many states from streamlit `session_state`.
+
+        Triggers associated with each state are run as in `get_value`.
+
+        Args:
+            states (List[str]):
+                Name of the states that will be fetched.
+            default_value (Any):
+                Return a default value if state is not found on Streamlit
+                states. If not informed, raise an error if state is not
+                found.
+        Kwargs:
+            Other arguments will be passed as kwargs to function associated
+            with the triggers.
+        Return:
+            Return a dictionary with state name as key and its value.
+        """
+        return {
+            state: cls.get_value(
+                state=state, default_value=default_value, **kwargs)
+            for state in states}
+
+    @classmethod
+    def set_many(cls, updates: dict, ignore_init_error: bool = False,
+                 **kwargs) -> bool:
+        """
+        Set many states at streamlit `session_state`.
+
+        All states are validated before any change. StateBeforeSetTrigger
+        of all states run before values are setted and
+        StateAfterSetTrigger of all states run after all values were
+        setted, so after triggers see the whole update.
+
+        Args:
+            updates (dict):
+                Dictionary with state name as key and value that will be
+                setted.
+            ignore_init_error (bool) = False:
+                Do not raise error if state was not initiated.
+        Kwargs:
+            Other arguments will be passed as kwargs to function associated
+            with the triggers.
+        Return:
+            Return True if all states were setted.
+        """
+        session_state = st.session_state
+        if not ignore_init_error:
+            for state in updates.keys():
+                if state not in session_state:
+                    msg = (
+                        "State [{state}] was not found at Streamlit "
+                        "`session_state`. Check if state was initiated or "
+                        "set argument `ignore_init_error=True`.")
+                    raise PumpwoodStreamlitStateNotFoundException(
+                        message=msg, payload={"state": state})
+
+        compiled_triggers = cls._get_compiled_triggers()
+        list_state_triggers = [
+            compiled_triggers[state] for state in updates.keys()
+            if state in compiled_triggers]
+        for _, _, before_set, _ in list_state_triggers:
+            for trigger in before_set:
+                trigger.run(**kwargs)
+
+        for state, value in updates.items():
+            session_state[state] = value
+
+        for _, _, _, after_set in list_state_triggers:
+            for trigger in after_set:
                 trigger.run(**kwargs)
         return True
 
@@ -268,17 +507,17 @@ class StateManager:
             Return a dictionary with mananeged states and its triggers.
         """
         return_dict = {}
-        for key, item in st.session_state.items:
-            is_managed = key.startswith('pumpwood_st__')
+        get_triggers = cls.TRIGGERS.get
+        prefix = cls._PREFIX
+        prefix_len = cls._PREFIX_LEN
+        for key in st.session_state.keys():
+            is_managed = key.startswith(prefix)
             state = key
             if is_managed:
-                state = key.lstrip('pumpwood_st__')
+                state = key[prefix_len:]
 
-            trigger_list = cls.TRIGGERS.get(state, [])
-            list_trigger = []
-            for t in trigger_list:
-                list_trigger.append(t.to_dict())
             return_dict[state] = {
-                "is_managed": True, "streamlit_state": key,
-                "manager": state, "triggers": list_trigger}
+                "is_managed": is_managed, "streamlit_state": key,
+                "manager": state, "triggers": [
+                    t.to_dict() for t in get_triggers(state, ())]}
         return return_dict